@@ -5,31 +5,42 @@ import time
 import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from typing import List, Tuple
-from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import OrderedDict
 from PIL import Image, ImageTk
 import json
 import keyboard
 import threading
+import hashlib
+import queue
 from datetime import datetime
 
 class ImageClicker:
-    def __init__(self, template_folder: str = "templates", confidence_threshold: float = 0.8, scale_factor: float = 0.5, interval: float = 0.5):
+    def __init__(self, template_folder: str = "templates", confidence_threshold: float = 0.8, scale_factor: float = 0.5, interval: float = 0.5,
+                 frame_budget: Optional[float] = None):
         self.templates: List[Tuple[np.ndarray, str, str]] = []  # (template, path, click_action)
+        self.match_stats: Dict[str, Tuple[float, float]] = {}  # path -> (last score, latency in ms)
+        self.template_priorities: Dict[str, Tuple[int, bool]] = {}  # path -> (priority, exclusive)
+        self.in_flight: Dict[Future, Tuple[np.ndarray, str, str, bool]] = {}  # future -> (template, path, click_action, dispatch)
         self.template_folder = template_folder
         self.confidence_threshold = confidence_threshold
         self.scale_factor = scale_factor
         self.interval = interval
+        self.frame_budget = interval if frame_budget is None else min(frame_budget, interval)
         self.running = False
         self.paused = False
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0.05
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.max_workers = 4
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers + 1)  # spare worker for templates that outrank everything in flight
         self.load_templates()
 
     def load_templates(self) -> None:
         """Load all images from the specified folder as templates with default click action."""
         self.templates.clear()
+        self.match_stats.clear()
+        self.template_priorities.clear()
         if not os.path.isdir(self.template_folder):
             print(f"Template folder not found: {self.template_folder}")
             return
@@ -46,8 +57,8 @@ class ImageClicker:
                 self.templates.append((template, image_path, "Left Click"))
                 print(f"Added template: {image_path}")
 
-    def add_template(self, image_path: str, click_action: str = "Left Click") -> bool:
-        """Add a single template image with specified click action."""
+    def add_template(self, image_path: str, click_action: str = "Left Click", priority: int = 0, exclusive: bool = False) -> bool:
+        """Add a single template image with specified click action and priority."""
         if not os.path.exists(image_path):
             print(f"Image not found: {image_path}")
             return False
@@ -57,6 +68,7 @@ class ImageClicker:
             return False
         template = cv2.resize(template, (0, 0), fx=self.scale_factor, fy=self.scale_factor)
         self.templates.append((template, image_path, click_action))
+        self.template_priorities[image_path] = (priority, exclusive)
         print(f"Added template: {image_path} with action {click_action}")
         return True
 
@@ -65,6 +77,8 @@ class ImageClicker:
         for template, path, _ in self.templates[:]:
             if path == image_path:
                 self.templates.remove((template, path, _))
+                self.match_stats.pop(image_path, None)
+                self.template_priorities.pop(image_path, None)
                 print(f"Removed template: {image_path}")
                 return True
         print(f"Template not found: {image_path}")
@@ -79,6 +93,19 @@ class ImageClicker:
                 return True
         return False
 
+    def update_priority(self, image_path: str, priority: int, exclusive: bool) -> bool:
+        """Update the matching priority and exclusive flag for a specific template."""
+        for _, path, _ in self.templates:
+            if path == image_path:
+                self.template_priorities[image_path] = (priority, exclusive)
+                print(f"Updated priority for {image_path} to {priority}{' (exclusive)' if exclusive else ''}")
+                return True
+        return False
+
+    def get_priority(self, image_path: str) -> Tuple[int, bool]:
+        """Return the (priority, exclusive) pair for a template, defaulting to (0, False)."""
+        return self.template_priorities.get(image_path, (0, False))
+
     def capture_screen(self) -> np.ndarray:
         """Capture the current screen as a grayscale image."""
         screenshot = pyautogui.screenshot()
@@ -104,30 +131,102 @@ class ImageClicker:
             pyautogui.doubleClick(center_x, center_y)
         log_callback(f"{click_action} on {os.path.basename(image_path)} at ({center_x}, {center_y})")
 
-    def process_template(self, template: np.ndarray, image_path: str, click_action: str, screen: np.ndarray, log_callback):
-        """Process a single template match and click if found."""
+    def process_template(self, template: np.ndarray, image_path: str, screen: np.ndarray) -> Tuple[float, Tuple[int, int]]:
+        """Match a single template and record its score and latency."""
+        start_time = time.perf_counter()
         max_val, max_loc, image_path = self.find_template(screen, template, image_path)
-        if max_val >= self.confidence_threshold:
-            print(f"Found match for {image_path}: confidence={max_val:.2f}")
-            log_callback(f"Match found for {os.path.basename(image_path)}: confidence={max_val:.2f}")
-            self.click_on_template(max_loc, template.shape, image_path, click_action, log_callback)
-        else:
+        self.match_stats[image_path] = (max_val, (time.perf_counter() - start_time) * 1000)
+        if max_val < self.confidence_threshold:
             print(f"No match for {image_path}: confidence={max_val:.2f}")
+        return max_val, max_loc
+
+    def process_frame(self, screen: np.ndarray, carried_over: List[str], log_callback) -> List[str]:
+        """Match templates by priority within the frame budget and return the paths left for the next frame."""
+        deadline = time.time() + self.frame_budget
+        carried_over = set(carried_over)
+        running = self.in_flight  # future -> (template, path, click_action, dispatch)
+        queued = sorted(self.templates, key=lambda entry: (-self.get_priority(entry[1])[0], entry[1] not in carried_over))
+        pending_exclusive: Dict[int, int] = {}  # priority -> exclusive templates not yet matched this frame
+        for _, image_path, _ in queued:
+            priority, exclusive = self.get_priority(image_path)
+            if exclusive:
+                pending_exclusive[priority] = pending_exclusive.get(priority, 0) + 1
+        held = []  # (priority, template, path, click_action, max_val, max_loc) hits waiting on a higher-priority exclusive template
+        while queued or held or any(entry[3] for entry in running.values()):
+            busy = {entry[1] for entry in running.values()}
+            while time.time() < deadline:
+                index = next((i for i, entry in enumerate(queued) if entry[1] not in busy), None)
+                if index is None:
+                    break
+                priority = self.get_priority(queued[index][1])[0]
+                outranks = all(priority > self.get_priority(entry[1])[0] for entry in running.values())
+                if len(running) >= self.max_workers + (1 if outranks else 0):
+                    break
+                template, image_path, click_action = queued.pop(index)
+                future = self.executor.submit(self.process_template, template, image_path, screen)
+                running[future] = (template, image_path, click_action, True)
+                busy.add(image_path)
+            remaining = deadline - time.time()
+            # Templates already carried over may finish past the deadline so slow ones are not starved
+            starved = [future for future, entry in running.items() if entry[3] and entry[1] in carried_over]
+            if not running or (remaining <= 0 and not starved):
+                break
+            if remaining > 0:
+                done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+            else:
+                done, _ = wait(starved, return_when=FIRST_COMPLETED)
+            for future in done:
+                template, image_path, click_action, dispatch = running.pop(future)
+                if not dispatch:
+                    continue  # started in an earlier frame or dropped by an exclusive hit
+                priority, exclusive = self.get_priority(image_path)
+                if exclusive and pending_exclusive.get(priority):
+                    pending_exclusive[priority] -= 1
+                max_val, max_loc = future.result()
+                if max_val >= self.confidence_threshold:
+                    held.append((priority, template, image_path, click_action, max_val, max_loc))
+            held.sort(key=lambda hit: -hit[0])
+            while held:
+                blocking = max((priority for priority, count in pending_exclusive.items() if count), default=-1)
+                if held[0][0] < blocking:
+                    break
+                priority, template, image_path, click_action, max_val, max_loc = held.pop(0)
+                print(f"Found match for {image_path}: confidence={max_val:.2f}")
+                log_callback(f"Match found for {os.path.basename(image_path)}: confidence={max_val:.2f}")
+                self.click_on_template(max_loc, template.shape, image_path, click_action, log_callback)
+                if self.get_priority(image_path)[1]:
+                    queued = [entry for entry in queued if self.get_priority(entry[1])[0] >= priority]
+                    held = [hit for hit in held if hit[0] >= priority]
+                    pending_exclusive = {p: count for p, count in pending_exclusive.items() if p >= priority}
+                    for other, entry in list(running.items()):
+                        if entry[3] and self.get_priority(entry[1])[0] < priority:
+                            if other.cancel():
+                                del running[other]
+                            else:
+                                running[other] = entry[:3] + (False,)  # let it finish, but ignore the result
+        leftover = [image_path for _, _, image_path, _, _, _ in held] + [image_path for _, image_path, _ in queued]
+        for future, entry in list(running.items()):
+            if entry[3]:
+                leftover.append(entry[1])
+            if future.cancel():
+                del running[future]
+            else:
+                running[future] = entry[:3] + (False,)  # its screenshot is stale by the next frame
+        return leftover
 
     def run(self, log_callback):
-        """Main loop with parallel template matching."""
+        """Main loop with prioritised parallel template matching."""
         self.running = True
+        self.in_flight = {}
+        carried_over = []
         try:
             while self.running:
                 if not self.paused:
                     start_time = time.time()
                     screen = self.capture_screen()
-                    futures = [
-                        self.executor.submit(self.process_template, template, image_path, click_action, screen, log_callback)
-                        for template, image_path, click_action in self.templates
-                    ]
-                    for future in futures:
-                        future.result()
+                    carried_over = self.process_frame(screen, carried_over, log_callback)
+                    if carried_over:
+                        print(f"Frame budget exceeded, carrying over {len(carried_over)} templates")
                     elapsed = time.time() - start_time
                     time.sleep(max(0, self.interval - elapsed))
                 else:
@@ -145,12 +244,114 @@ class ImageClicker:
         self.paused = not self.paused
         return self.paused
 
+class ThumbnailCache:
+    def __init__(self, cache_folder: str = ".thumbnail_cache", size: Tuple[int, int] = (100, 100), max_entries: int = 256):
+        self.memory: "OrderedDict[str, Tuple[int, Image.Image]]" = OrderedDict()  # path -> (mtime_ns, thumbnail), least recently used first
+        self.failed: Dict[str, int] = {}  # path -> mtime_ns of the file that failed to load
+        self.cache_folder = cache_folder
+        self.size = size
+        self.max_entries = max_entries
+        self.pending: Dict[str, Future] = {}  # path -> queued or running generate job
+        self.visible = set()  # paths currently shown, the only ones worth generating
+        self.results = queue.Queue()  # (path, error) for every finished request
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    def get(self, image_path: str) -> Optional[Image.Image]:
+        """Return the cached thumbnail if it matches the file's current mtime, else None."""
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError:
+            return None
+        with self.lock:
+            entry = self.memory.get(image_path)
+            if entry is not None and entry[0] == mtime:
+                self.memory.move_to_end(image_path)
+                return entry[1]
+        return None
+
+    def set_visible(self, image_paths) -> None:
+        """Record which paths are on screen and cancel queued requests for the rest."""
+        with self.lock:
+            self.visible = set(image_paths)
+            for image_path, future in list(self.pending.items()):
+                if image_path not in self.visible and future.cancel():
+                    del self.pending[image_path]
+
+    def request(self, image_path: str) -> None:
+        """Generate the thumbnail for a template in the background unless already queued."""
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError:
+            return
+        with self.lock:
+            if image_path in self.pending or self.failed.get(image_path) == mtime:
+                return
+            self.pending[image_path] = self.executor.submit(self.generate, image_path, mtime)
+
+    def generate(self, image_path: str, mtime: int) -> None:
+        """Load a thumbnail from the disk cache or build it from the source image."""
+        with self.lock:
+            if image_path not in self.visible:
+                self.pending.pop(image_path, None)
+                return
+        error = None
+        try:
+            prefix = hashlib.sha1(os.path.abspath(image_path).encode("utf-8")).hexdigest()
+            cache_name = f"{prefix}-{mtime}.png"
+            cache_path = os.path.join(self.cache_folder, cache_name)
+            thumbnail = None
+            if os.path.exists(cache_path):
+                try:
+                    with Image.open(cache_path) as img:
+                        thumbnail = img.copy()
+                except Exception as e:
+                    print(f"Discarding unreadable thumbnail cache for {image_path}: {e}")
+                    try:
+                        os.remove(cache_path)
+                    except OSError:
+                        pass
+            if thumbnail is None:
+                with Image.open(image_path) as img:
+                    thumbnail = img.convert("RGBA").resize(self.size, Image.Resampling.LANCZOS)
+                try:
+                    os.makedirs(self.cache_folder, exist_ok=True)
+                    for filename in os.listdir(self.cache_folder):
+                        if filename.startswith(f"{prefix}-") and filename != cache_name:
+                            os.remove(os.path.join(self.cache_folder, filename))
+                    thumbnail.save(cache_path)
+                except OSError as e:
+                    print(f"Failed to write thumbnail cache for {image_path}: {e}")
+            with self.lock:
+                self.memory[image_path] = (mtime, thumbnail)
+                self.memory.move_to_end(image_path)
+                while len(self.memory) > self.max_entries:
+                    self.memory.popitem(last=False)
+        except Exception as e:
+            error = e
+            with self.lock:
+                self.failed[image_path] = mtime
+        finally:
+            with self.lock:
+                self.pending.pop(image_path, None)
+        self.results.put((image_path, error))
+
+    def drain(self) -> List[Tuple[str, Optional[Exception]]]:
+        """Return all requests finished since the last call."""
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                return finished
+
 class ClickerGUI:
     def __init__(self, clicker: ImageClicker):
         self.clicker = clicker
+        self.thumbnail_cache = ThumbnailCache()
         self.root = tk.Tk()
         self.root.title("Trigger Clicker")
-        self.root.geometry("600x850")
+        self.root.geometry("600x930")
         self.root.resizable(False, False)
 
         # Theme definitions
@@ -221,6 +422,13 @@ class ClickerGUI:
         self.action_combo.pack(side=tk.LEFT, padx=5)
         self.action_combo.bind("<<ComboboxSelected>>", self.on_action_select)
         ttk.Button(self.template_frame, text="Apply Action", command=self.update_click_action).pack(side=tk.LEFT, padx=5)
+        priority_frame = ttk.Frame(self.main_frame)
+        priority_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(priority_frame, text="Priority (0-100):").pack(side=tk.LEFT)
+        self.priority_var = tk.IntVar(value=0)
+        ttk.Spinbox(priority_frame, textvariable=self.priority_var, from_=0, to=100, width=5).pack(side=tk.LEFT, padx=5)
+        self.exclusive_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(priority_frame, text="Exclusive (skip lower priorities on match)", variable=self.exclusive_var).pack(side=tk.LEFT, padx=5)
         template_button_frame = ttk.Frame(self.main_frame)
         template_button_frame.pack(fill=tk.X)
         ttk.Button(template_button_frame, text="Add Template", command=self.add_template).pack(side=tk.LEFT, padx=5)
@@ -243,6 +451,11 @@ class ClickerGUI:
         self.interval_var = tk.DoubleVar(value=self.clicker.interval)
         ttk.Entry(self.main_frame, textvariable=self.interval_var, width=10).pack(anchor="w", pady=5)
 
+        # Frame budget
+        ttk.Label(self.main_frame, text="Frame Budget (0.05 seconds up to the scan interval):").pack(anchor="w")
+        self.frame_budget_var = tk.DoubleVar(value=self.clicker.frame_budget)
+        ttk.Entry(self.main_frame, textvariable=self.frame_budget_var, width=10).pack(anchor="w", pady=5)
+
         # Hotkey selection
         ttk.Label(self.main_frame, text="Toggle Hotkey:").pack(anchor="w")
         self.hotkey_var = tk.StringVar(value="Ctrl+P")
@@ -334,17 +547,21 @@ class ClickerGUI:
             self.reload_templates()
 
     def add_template(self):
-        """Add a single template image with selected click action."""
+        """Add a single template image with selected click action and priority."""
+        priority = self.get_priority_input()
+        if priority is None:
+            return
         file_path = filedialog.askopenfilename(filetypes=[("Image files", "*.png *.jpg *.jpeg *.bmp")])
         if file_path:
             selected_action = self.action_var.get()
             if selected_action not in self.click_actions:
                 selected_action = "Left Click"
                 self.action_var.set(selected_action)
-            if self.clicker.add_template(file_path, selected_action):
+            exclusive = self.exclusive_var.get()
+            if self.clicker.add_template(file_path, selected_action, priority, exclusive):
                 self.update_template_list()
                 self.status_var.set(f"Loaded {len(self.clicker.templates)} templates")
-                self.log(f"Added template: {os.path.basename(file_path)} with action {selected_action}")
+                self.log(f"Added template: {os.path.basename(file_path)} with action {selected_action}, priority {priority}")
                 self.save_settings()
 
     def remove_template(self):
@@ -374,6 +591,8 @@ class ClickerGUI:
             self.last_selected_template = None
             self.action_var.set("Left Click")
             self.action_combo['values'] = self.click_actions
+            self.priority_var.set(0)
+            self.exclusive_var.set(False)
             self.log("No template selected, set dropdown to default: Left Click")
 
     def on_action_select(self, event=None):
@@ -410,14 +629,31 @@ class ClickerGUI:
             for _, path, click_action in self.clicker.templates:
                 if os.path.basename(path) == template_name:
                     self.action_var.set(click_action)
+                    priority, exclusive = self.clicker.get_priority(path)
+                    self.priority_var.set(priority)
+                    self.exclusive_var.set(exclusive)
                     self.log(f"Set dropdown to {click_action} for {template_name}, index: {self.last_selected_template}")
                     return
         self.last_selected_template = None
         self.action_var.set("Left Click")
+        self.priority_var.set(0)
+        self.exclusive_var.set(False)
         self.log("No template selected or selection mismatch, set dropdown to default: Left Click")
 
+    def get_priority_input(self) -> Optional[int]:
+        """Return the priority entered in the spinbox, or show an error and return None if it is invalid."""
+        try:
+            priority = self.priority_var.get()
+        except tk.TclError:
+            priority = -1
+        if not (0 <= priority <= 100):
+            self.log("Invalid priority entered")
+            messagebox.showerror("Error", "Priority must be a whole number between 0 and 100")
+            return None
+        return priority
+
     def update_click_action(self):
-        """Update the click action for the selected template."""
+        """Update the click action, priority and exclusive flag for the selected template."""
         if self.last_selected_template is None or not self.template_listbox.curselection():
             self.log("No template selected for click action update")
             messagebox.showinfo("Info", "Please select a template to update its click action")
@@ -428,10 +664,15 @@ class ClickerGUI:
             self.log(f"Invalid click action selected: {selected_action}")
             self.action_var.set("Left Click")
             selected_action = "Left Click"
+        priority = self.get_priority_input()
+        if priority is None:
+            return
+        exclusive = self.exclusive_var.get()
         for _, path, _ in self.clicker.templates:
             if os.path.basename(path) == template_name:
                 self.clicker.update_click_action(path, selected_action)
-                self.log(f"Applied click action for {template_name} to {selected_action}")
+                self.clicker.update_priority(path, priority, exclusive)
+                self.log(f"Applied click action for {template_name} to {selected_action}, priority {priority}{' (exclusive)' if exclusive else ''}")
                 self.save_settings()
                 self.update_template_list()  # Refresh to ensure selection is maintained
                 break
@@ -454,17 +695,25 @@ class ClickerGUI:
             confidence = self.confidence_var.get()
             scale = self.scale_var.get()
             interval = self.interval_var.get()
+            frame_budget = self.frame_budget_var.get()
             if not (0.0 <= confidence <= 1.0):
                 raise ValueError("Confidence threshold must be between 0.0 and 1.0")
             if not (0.1 <= scale <= 1.0):
                 raise ValueError("Scale factor must be between 0.1 and 1.0")
             if not (0.1 <= interval <= 2.0):
                 raise ValueError("Scan interval must be between 0.1 and 2.0 seconds")
+            if frame_budget < 0.05:
+                raise ValueError("Frame budget must be at least 0.05 seconds")
+            if frame_budget > interval:
+                frame_budget = interval
+                self.frame_budget_var.set(frame_budget)
+                self.log(f"Frame budget clamped to the scan interval: {frame_budget}")
             if not self.clicker.templates:
                 raise ValueError("No templates loaded. Select a folder with images.")
             self.clicker.confidence_threshold = confidence
             self.clicker.scale_factor = scale
             self.clicker.interval = interval
+            self.clicker.frame_budget = frame_budget
             self.status_var.set("Running...")
             self.log("Clicker started")
             threading.Thread(target=self.clicker.run, args=(self.log,), daemon=True).start()
@@ -563,38 +812,83 @@ class ClickerGUI:
         self.log("Clicker paused" if paused else "Clicker resumed")
 
     def view_templates(self):
-        """Show a window with previews of loaded templates."""
+        """Show a window with lazily rendered previews and live match stats of loaded templates."""
         if not self.clicker.templates:
             messagebox.showinfo("Info", "No templates loaded")
             return
 
+        theme = self.themes[self.current_theme]
+        row_height = self.thumbnail_cache.size[1] + 10
         preview_window = tk.Toplevel(self.root)
         preview_window.title("Template Previews")
         preview_window.geometry("600x400")
-        preview_window.configure(bg=self.themes[self.current_theme]["bg"])
-        canvas = tk.Canvas(preview_window, bg=self.themes[self.current_theme]["bg"])
-        scrollbar = ttk.Scrollbar(preview_window, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        preview_window.configure(bg=theme["bg"])
+        canvas = tk.Canvas(preview_window, bg=theme["bg"], highlightthickness=0, yscrollincrement=row_height)
+        scrollbar = ttk.Scrollbar(preview_window, orient=tk.VERTICAL)
         canvas.configure(yscrollcommand=scrollbar.set)
-
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        for _, image_path, click_action in self.clicker.templates:
-            try:
-                img = Image.open(image_path)
-                img = img.resize((100, 100), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                label = ttk.Label(scrollable_frame, image=photo, text=f"{os.path.basename(image_path)} ({click_action})", 
-                                compound=tk.TOP, background=self.themes[self.current_theme]["bg"],
-                                foreground=self.themes[self.current_theme]["fg"])
-                label.image = photo
-                label.pack(pady=5)
-            except Exception as e:
-                self.log(f"Failed to load preview for {image_path}: {e}")
+        photos = {}  # path -> (thumbnail, PhotoImage), only for visible rows
+
+        def render():
+            """Draw only the rows currently inside the viewport."""
+            templates = list(self.clicker.templates)
+            canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), len(templates) * row_height))
+            top = canvas.canvasy(0)
+            first = max(0, int(top // row_height))
+            last = min(len(templates), int((top + canvas.winfo_height()) // row_height) + 1)
+            canvas.delete("row")
+            visible = {templates[index][1] for index in range(first, last)}
+            self.thumbnail_cache.set_visible(visible)
+            for index in range(first, last):
+                _, image_path, click_action = templates[index]
+                y = index * row_height + 5
+                thumbnail = self.thumbnail_cache.get(image_path)
+                if thumbnail is None:
+                    self.thumbnail_cache.request(image_path)
+                    canvas.create_rectangle(10, y, 10 + self.thumbnail_cache.size[0], y + self.thumbnail_cache.size[1],
+                                            outline=theme["fg"], dash=(2, 2), tags="row")
+                else:
+                    entry = photos.get(image_path)
+                    if entry is None or entry[0] is not thumbnail:
+                        entry = (thumbnail, ImageTk.PhotoImage(thumbnail))
+                        photos[image_path] = entry
+                    canvas.create_image(10, y, image=entry[1], anchor="nw", tags="row")
+                stats = self.clicker.match_stats.get(image_path)
+                stats_text = f"Score: {stats[0]:.2f}   Latency: {stats[1]:.1f} ms" if stats else "Score: -   Latency: -"
+                text_x = 25 + self.thumbnail_cache.size[0]
+                canvas.create_text(text_x, y + 35, text=f"{os.path.basename(image_path)} ({click_action})",
+                                   anchor="w", fill=theme["fg"], tags="row")
+                canvas.create_text(text_x, y + 60, text=stats_text, anchor="w", fill=theme["fg"], tags="row")
+            for image_path in list(photos):
+                if image_path not in visible:
+                    del photos[image_path]
+
+        def scroll(*args):
+            canvas.yview(*args)
+            render()
+
+        def refresh():
+            """Pick up finished thumbnails and live match stats."""
+            if not preview_window.winfo_exists():
+                return
+            for image_path, error in self.thumbnail_cache.drain():
+                if error is not None:
+                    self.log(f"Failed to load preview for {image_path}: {error}")
+            render()
+            preview_window.after(250, refresh)
+
+        def close(event):
+            if event.widget is preview_window:
+                self.thumbnail_cache.set_visible(())
+
+        scrollbar.configure(command=scroll)
+        preview_window.bind("<Destroy>", close)
+        canvas.bind("<Configure>", lambda e: render())
+        canvas.bind("<MouseWheel>", lambda e: scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        canvas.bind("<Button-4>", lambda e: scroll("scroll", -1, "units"))
+        canvas.bind("<Button-5>", lambda e: scroll("scroll", 1, "units"))
+        refresh()
 
     def save_settings(self):
         """Save settings to a JSON file."""
@@ -603,12 +897,14 @@ class ClickerGUI:
             "confidence_threshold": self.confidence_var.get(),
             "scale_factor": self.scale_var.get(),
             "interval": self.interval_var.get(),
+            "frame_budget": self.frame_budget_var.get(),
             "hotkey_enabled": self.hotkey_enabled_var.get(),
             "hotkey": self.hotkey_var.get(),
             "custom_hotkey": self.custom_hotkey_var.get(),
             "theme": self.current_theme,
             "templates": [
-                {"path": path, "click_action": click_action}
+                {"path": path, "click_action": click_action,
+                 "priority": self.clicker.get_priority(path)[0], "exclusive": self.clicker.get_priority(path)[1]}
                 for _, path, click_action in self.clicker.templates
             ]
         }
@@ -630,6 +926,7 @@ class ClickerGUI:
                 self.confidence_var.set(settings.get("confidence_threshold", 0.8))
                 self.scale_var.set(settings.get("scale_factor", 0.5))
                 self.interval_var.set(settings.get("interval", 0.5))
+                self.frame_budget_var.set(min(settings.get("frame_budget", self.interval_var.get()), self.interval_var.get()))
                 self.hotkey_enabled_var.set(settings.get("hotkey_enabled", False))
                 self.hotkey_var.set(settings.get("hotkey", "Ctrl+P"))
                 self.custom_hotkey_var.set(settings.get("custom_hotkey", ""))
@@ -639,8 +936,13 @@ class ClickerGUI:
                 for template_data in settings.get("templates", []):
                     path = template_data.get("path", "")
                     click_action = template_data.get("click_action", "Left Click")
+                    try:
+                        priority = min(max(int(template_data.get("priority", 0)), 0), 100)
+                    except (TypeError, ValueError):
+                        priority = 0
+                    exclusive = template_data.get("exclusive", False) is True
                     if os.path.exists(path):
-                        self.clicker.add_template(path, click_action)
+                        self.clicker.add_template(path, click_action, priority, exclusive)
                 self.update_template_list()
                 self.status_var.set(f"Loaded {len(self.clicker.templates)} templates")
                 if self.hotkey_var.get() == "Custom":